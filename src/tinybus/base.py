@@ -21,9 +21,16 @@
 # SOFTWARE.
 
 import asyncio
-
-from typing import Any, Callable, Optional, TypeVar, get_type_hints, Generic
-from collections import defaultdict
+import functools
+import inspect
+import math
+import sys
+import types
+import weakref
+
+from typing import (
+    Any, Callable, Iterable, NamedTuple, Optional, TypeVar, Union, get_args, get_origin, get_type_hints, Generic
+)
 from pydantic import BaseModel
 
 from .exceptions import (
@@ -32,12 +39,126 @@ from .exceptions import (
     HandlerExecutionError,
     HandlerTimeoutError
 )
-from .models import MessageHandler, EventHandler, DeliveryOptions, Message
+from .models import MessageHandler, EventHandler, DeliveryOptions, Message, _FastMessage
 
 T = TypeVar('T')  # Message body type
 R = TypeVar('R')  # Response type
 
 
+_MISSING = object()
+_DEFAULT_OPTIONS = DeliveryOptions()
+
+
+def _intern(key: str) -> str:
+    """Intern plain string keys so dict lookups can settle on pointer equality"""
+    # sys.intern() only accepts exact str instances, str based Enum members are kept as they are
+    return sys.intern(key) if type(key) is str else key
+
+
+def _takes_message(handler: Callable, hints: dict[str, Any], bound: bool) -> bool:
+    """Whether a handler expects its payload wrapped in a Message, given its resolved type hints"""
+    if inspect.isfunction(handler):
+        code = handler.__code__
+        parameters = code.co_varnames[:code.co_argcount]
+    else:
+        parameters = tuple(inspect.signature(handler).parameters)
+    if bound:
+        # Drop the parameter the instance is bound to
+        parameters = parameters[1:]
+
+    if not parameters:
+        return True
+
+    # Only a parameter annotated with a class a Message can't satisfy receives the raw payload,
+    # anything else (no annotation, Any, unions, Message or its bases...) keeps getting the envelope
+    annotation = hints.get(parameters[0])
+    if annotation is Any or not isinstance(annotation, type):
+        return True
+    return issubclass(annotation, Message) or issubclass(Message, annotation)
+
+
+def handler[F: Callable](fn: F) -> F:
+    """
+    Resolve a message handler's type hints once, when it is defined.
+
+    The return type and whether the handler takes a Message are stored on the function so
+    EventBus.consumer() does not have to inspect its type hints at registration time.
+
+    Args:
+        fn: The handler function
+
+    Returns:
+        The same function
+    """
+    hints = get_type_hints(fn)
+    fn.__tinybus_return__ = hints.get('return', None)
+    # Whether the function ends up bound to an instance is only known once it is registered, so
+    # store both answers, indexed by that
+    fn.__tinybus_takes_message__ = (_takes_message(fn, hints, False), _takes_message(fn, hints, True))
+    return fn
+
+
+def _function_cache[**P, V](resolve: Callable[P, V]) -> Callable[P, V]:
+    """
+    Memoize a resolver per handler function, without keeping the function alive.
+
+    Only plain functions are cached (weakly, so handlers that go away are dropped from the cache),
+    any other callable may be unhashable and is resolved on every call.
+    """
+    cache: weakref.WeakKeyDictionary[Callable, dict[tuple, V]] = weakref.WeakKeyDictionary()
+
+    @functools.wraps(resolve)
+    def wrapper(fn, *args):
+        if not inspect.isfunction(fn):
+            return resolve(fn, *args)
+
+        results = cache.get(fn)
+        if results is None:
+            results = cache[fn] = {}
+        if args not in results:
+            results[args] = resolve(fn, *args)
+        return results[args]
+
+    return wrapper
+
+
+@_function_cache
+def _cached_type_hints(handler: Callable) -> dict[str, Any]:
+    """Resolve (and memoize) the type hints of a handler"""
+    return get_type_hints(handler)
+
+
+def _return_type_validator(expected_return_type: Any) -> Optional[Callable[[Any], bool]]:
+    """Build the check request() runs on responses, None when the declared type can't be checked"""
+    if expected_return_type is Any:
+        # Any is a class since Python 3.11, but it refuses instance checks (and accepts everything)
+        return None
+
+    if isinstance(expected_return_type, type):
+        return expected_return_type.__instancecheck__
+
+    origin = get_origin(expected_return_type)
+    if isinstance(origin, type) and not get_args(expected_return_type):
+        # Bare typing aliases (List, Dict, Sequence...) stand for their origin class
+        return origin.__instancecheck__
+
+    if origin in (Union, types.UnionType):
+        members = get_args(expected_return_type)
+        if all(isinstance(member, type) and member is not Any for member in members):
+            return lambda response: isinstance(response, members)
+
+    # Parametrized generics (list[int]...), Literal, TypeVars... can't be checked at runtime
+    return None
+
+
+class _ConsumerRecord(NamedTuple):
+    """Everything request() needs to know about a registered consumer, resolved at registration"""
+    handler: MessageHandler
+    return_type: Optional[type]
+    validate: Optional[Callable[[Any], bool]]
+    takes_message: bool
+
+
 class Consumer(Generic[T, R]):
     """
     Represents a registered message consumer.
@@ -48,6 +169,8 @@ class Consumer(Generic[T, R]):
         handler: The handler function
     """
 
+    __slots__ = ('event_bus', 'address', 'handler')
+
     def __init__(self, event_bus: 'EventBus', address: str, handler: MessageHandler[T, R]):
         self.event_bus = event_bus
         self.address = address
@@ -68,6 +191,8 @@ class Listener:
         handler: The handler function
     """
 
+    __slots__ = ('event_bus', 'event', 'handler')
+
     def __init__(self, event_bus: 'EventBus', event: str, handler: EventHandler):
         self.event_bus = event_bus
         self.event = event
@@ -90,9 +215,10 @@ class EventBus:
     """
 
     def __init__(self):
-        self._consumers: dict[str, tuple[MessageHandler, Optional[type]]] = {}
-        self._listeners: defaultdict[str, list[EventHandler]] = defaultdict(list)
-        self._reply_futures: dict[str, asyncio.Future] = {}
+        self._consumers: dict[str, _ConsumerRecord] = {}
+        # Listener tuples are never mutated in place, they are rebuilt on every (un)registration so
+        # readers always get a stable snapshot without having to copy it
+        self._listeners: dict[str, tuple[EventHandler, ...]] = {}
 
     def consumer(
             self,
@@ -102,6 +228,14 @@ class EventBus:
         """
         Register a message handler for a specific address.
 
+        Handlers receive the payload wrapped in a Message, unless their first parameter is annotated
+        with a class that is neither Message nor one of its bases, in which case the payload is passed
+        to them as is.
+
+        Responses are checked against the handler's return annotation when it is a class, a bare
+        typing alias (List, Dict...) or a union of classes. Other annotations, such as parametrized
+        generics (list[int]), are not checked.
+
         Args:
             address: The address to handle messages for
             handler: The async function that will handle messages
@@ -112,14 +246,31 @@ class EventBus:
         Raises:
             HandlerAlreadyRegisteredError: If a handler is already registered for this address
         """
-        if address in self._consumers:
-            raise HandlerAlreadyRegisteredError(f"Handler already registered for address: {address}")
+        # Resolve the return type and whether the handler takes a Message from its type hints, unless
+        # @handler already did. Bound methods are keyed on their underlying function so the cache
+        # never keeps the instances they are bound to alive
+        function = getattr(handler, '__func__', handler)
+        bound = inspect.ismethod(handler)
+
+        expected_return_type = getattr(handler, '__tinybus_return__', _MISSING)
+        if expected_return_type is _MISSING:
+            expected_return_type = _cached_type_hints(function).get('return', None)
+
+        # Handlers that take the payload itself (rather than a Message) get it passed through as is
+        takes_message = getattr(handler, '__tinybus_takes_message__', _MISSING)
+        if takes_message is _MISSING:
+            takes_message = _takes_message(function, _cached_type_hints(function), bound)
+        else:
+            takes_message = takes_message[bound]
+
+        # Build the instance check once so request() does not have to resolve it on every call
+        validate = _return_type_validator(expected_return_type)
 
-        # Extract the return type from the handler's type hints
-        handler_signature = get_type_hints(handler)
-        expected_return_type = handler_signature.get('return', None)
+        # Register and check for an existing consumer in a single dict operation
+        record = _ConsumerRecord(handler, expected_return_type, validate, takes_message)
+        if self._consumers.setdefault(_intern(address), record) is not record:
+            raise HandlerAlreadyRegisteredError(f"Handler already registered for address: {address}")
 
-        self._consumers[address] = (handler, expected_return_type)
         return Consumer(self, address, handler)
 
     def on(self, event: str, handler: Optional[EventHandler] = None) -> Callable[[EventHandler], Listener] | Listener:
@@ -136,7 +287,7 @@ class EventBus:
         """
 
         def decorator(handler_fn: EventHandler) -> Listener:
-            self._listeners[event].append(handler_fn)
+            self._listeners[_intern(event)] = self._listeners.get(event, ()) + (handler_fn,)
             return Listener(self, event, handler_fn)
 
         if handler is None:
@@ -165,28 +316,51 @@ class EventBus:
             HandlerExecutionError: If the handler fails during execution
             EventBusError: For other unexpected errors
         """
-        if address not in self._consumers:
+        record = self._consumers.get(address)
+        if record is None:
             raise HandlerNotFoundError(f"No handler registered for address: {address}")
 
-        options = options or DeliveryOptions()
-        handler, expected_return_type = self._consumers[address]
-        msg = Message[Any].create(message)
+        options = options or _DEFAULT_OPTIONS
+        handler, expected_return_type, validate, takes_message = record
+        msg = _FastMessage(body=message) if takes_message else message
 
+        deadline = None
         try:
-            response = await asyncio.wait_for(
-                handler(msg),
-                timeout=options.timeout
-            )
-            if expected_return_type is not None and not isinstance(response, expected_return_type):
-                raise TypeError(
-                    f"Handler for address '{address}' returned an invalid type: "
-                    f"expected '{expected_return_type.__name__}', got '{type(response).__name__}'"
-                )
+            if options.timeout is None or options.timeout == math.inf:
+                # No deadline, skip installing a timer on the loop
+                response = await handler(msg)
+            else:
+                # Unlike wait_for(), the timeout context applies to the current task and does not need
+                # to wrap the handler coroutine
+                async with asyncio.timeout(options.timeout) as deadline:
+                    response = await handler(msg)
+        except TimeoutError as e:
+            # Only our own deadline expiring is a timeout, a TimeoutError raised by the handler is a failure
+            if deadline is not None and deadline.expired():
+                raise HandlerTimeoutError(address, options.timeout) from e
+            raise HandlerExecutionError(address, e) from e
+        except Exception as e:
+            raise HandlerExecutionError(address, e) from e
+
+        # Validation failures are raised directly instead of bouncing through the except clauses above.
+        # Handlers almost always return exactly the declared class, so a plain identity comparison
+        # settles most checks before falling back to the full (ABC aware) instance check
+        if validate is None or type(response) is expected_return_type:
             return response
-        except asyncio.TimeoutError:
-            raise HandlerTimeoutError(address, options.timeout)
+
+        try:
+            valid = validate(response)
         except Exception as e:
-            raise HandlerExecutionError(address, e)
+            # Keep the documented contract even if the declared type's instance check misbehaves
+            raise HandlerExecutionError(address, e) from e
+
+        if not valid:
+            raise HandlerExecutionError(address, TypeError(
+                f"Handler for address '{address}' returned an invalid type: "
+                f"expected '{getattr(expected_return_type, '__name__', expected_return_type)}', "
+                f"got '{type(response).__name__}'"
+            ))
+        return response
 
     async def publish[T: BaseModel](self, event: str, message: T) -> None:
         """
@@ -196,12 +370,40 @@ class EventBus:
             event: The event name
             message: The event payload
         """
-        listeners = self._listeners[event]
-        if listeners:
-            # Wait for all listeners to complete
-            await asyncio.gather(
-                *(listener(message) for listener in listeners)
-            )
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+
+        if len(listeners) == 1:
+            # A single listener can be awaited directly, no need to go through gather()
+            await listeners[0](message)
+            return
+
+        # Wait for all listeners to complete. gather() cancels every listener when the publish is
+        # cancelled and retrieves the exceptions of the listeners that fail after the first one
+        await asyncio.gather(
+            *(listener(message) for listener in listeners)
+        )
+
+    async def batch_publish[T: BaseModel](self, event: str, messages: Iterable[T]) -> None:
+        """
+        Publish several events to all registered listeners at once.
+
+        Equivalent to publishing every message concurrently, but every listener call for every
+        message is gathered in one go instead of going through a separate publish() per message.
+
+        Args:
+            event: The event name
+            messages: The event payloads
+        """
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+
+        # A single gather() for the whole batch, with the same cancellation and error handling as publish()
+        await asyncio.gather(
+            *(listener(message) for message in messages for listener in listeners)
+        )
 
     def remove_consumer(self, address: str) -> None:
         """
@@ -220,10 +422,15 @@ class EventBus:
             event: The event name
             handler: The handler to remove
         """
-        if event in self._listeners:
-            self._listeners[event].remove(handler)
-            if not self._listeners[event]:
-                del self._listeners[event]
+        listeners = self._listeners.get(event)
+        if listeners is None:
+            return
+
+        index = listeners.index(handler)
+        if len(listeners) == 1:
+            del self._listeners[event]
+        else:
+            self._listeners[event] = listeners[:index] + listeners[index + 1:]
 
     def get_consumers(self) -> list[str]:
         """
@@ -234,7 +441,7 @@ class EventBus:
         """
         return list(self._consumers.keys())
 
-    def get_listeners(self, event: str) -> list[EventHandler]:
+    def get_listeners(self, event: str) -> tuple[EventHandler, ...]:
         """
         Get all listeners registered for an event.
 
@@ -242,6 +449,6 @@ class EventBus:
             event: The event name
 
         Returns:
-            List of handlers registered for the event
+            Snapshot of the handlers registered for the event
         """
-        return self._listeners[event].copy()
+        return self._listeners.get(event, ())
@@ -40,7 +40,11 @@ class HandlerExecutionError(EventBusError):
     def __init__(self, address: str, original_error: Exception):
         self.address = address
         self.original_error = original_error
-        super().__init__(f"Handler for address '{address}' failed: {str(original_error)}")
+        super().__init__(address, original_error)
+
+    def __str__(self) -> str:
+        # Only formatted when the error is actually rendered
+        return f"Handler for address '{self.address}' failed: {self.original_error}"
 
 
 class HandlerTimeoutError(EventBusError):
@@ -48,4 +52,7 @@ class HandlerTimeoutError(EventBusError):
     def __init__(self, address: str, timeout: float):
         self.address = address
         self.timeout = timeout
-        super().__init__(f"Handler for address '{address}' timed out after {timeout} seconds")
+        super().__init__(address, timeout)
+
+    def __str__(self) -> str:
+        return f"Handler for address '{self.address}' timed out after {self.timeout} seconds"
@@ -22,9 +22,10 @@
 
 import uuid
 
+from dataclasses import dataclass, field
 from typing import TypeAlias, Callable, Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 type MessageT[T: BaseModel] = T
 type ResponseT[R: BaseModel] = R
@@ -42,7 +43,7 @@ class Message[T](BaseModel):
         body: The message payload
         reply_address: Optional address for replies
     """
-    id: str = str(uuid.uuid4())
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     body: Optional[T] = None
     reply_address: Optional[str] = None
 
@@ -53,15 +54,39 @@ class Message[T](BaseModel):
         return cls(body=body)
 
 
-class DeliveryOptions(BaseModel):
+@dataclass(slots=True, frozen=True)
+class _FastMessage:
+    """
+    Lightweight message envelope used on the request hot path.
+
+    This is what handlers annotated with Message[T] actually receive. It mirrors the attributes of
+    Message without going through Pydantic validation, but it is not a Message instance and has
+    none of the Pydantic model methods. The id is only generated the first time it is accessed.
+
+    Attributes:
+        body: The message payload
+        reply_address: Optional address for replies
+    """
+    body: Any = None
+    reply_address: Optional[str] = None
+    _id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def id(self) -> str:
+        """Unique identifier for the message"""
+        if self._id is None:
+            object.__setattr__(self, '_id', uuid.uuid4().hex)
+        return self._id
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryOptions:
     """
     Configuration options for message delivery.
 
     Attributes:
-        timeout: Maximum time to wait for a response in seconds
+        timeout: Maximum time to wait for a response in seconds (None or math.inf to wait forever)
         retry_attempts: Number of retry attempts for failed deliveries
     """
-    timeout: float = 30.0
+    timeout: Optional[float] = 30.0
     retry_attempts: int = 0
-
-    model_config = {"arbitrary_types_allowed": True}
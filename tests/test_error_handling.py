@@ -22,6 +22,9 @@
 
 import pytest
 import asyncio
+import gc
+
+from typing import Any, List, Optional
 
 from tinybus.models import DeliveryOptions, Message
 from fixtures import TestRequest, TestResponse
@@ -64,6 +67,17 @@ async def test_handler_exceptions(event_bus):
     assert exc_info.value.timeout == 0.1
     assert exc_info.value.address == "timeout.address"
 
+    # Test handlers raising their own TimeoutError, with and without a deadline
+    async def own_timeout_handler(msg):
+        raise TimeoutError("Upstream timed out")
+
+    event_bus.consumer("own.timeout.address", own_timeout_handler)
+
+    for options in (DeliveryOptions(timeout=None), DeliveryOptions()):
+        with pytest.raises(HandlerExecutionError) as exc_info:
+            await event_bus.request("own.timeout.address", TestRequest(value="test"), options=options)
+        assert isinstance(exc_info.value.original_error, TimeoutError)
+
     # Test handler returning None
     async def none_handler(msg):
         return None
@@ -80,3 +94,137 @@ async def test_handler_exceptions(event_bus):
     with pytest.raises(HandlerExecutionError) as exc_info:
         await event_bus.request("invalid.address", TestRequest(value="test"))
     assert "returned an invalid type" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_publish_listener_failures(event_bus):
+    """Test that every listener outcome is handled when publishing fails or is cancelled"""
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    # Test multiple failing listeners
+    async def failing_listener(msg):
+        raise ValueError(f"Listener failed: {msg}")
+
+    event_bus.on("failing.event", failing_listener)
+    event_bus.on("failing.event", failing_listener)
+
+    with pytest.raises(ValueError):
+        await event_bus.publish("failing.event", "test")
+
+    # Let the remaining listener finish and be collected
+    await asyncio.sleep(0)
+    gc.collect()
+    assert unhandled == []
+
+    # Test cancelling a publish cancels every listener
+    outcomes = []
+
+    async def slow_listener(msg):
+        try:
+            await asyncio.sleep(1)
+            outcomes.append("finished")
+        except asyncio.CancelledError:
+            outcomes.append("cancelled")
+            raise
+
+    event_bus.on("slow.event", slow_listener)
+    event_bus.on("slow.event", slow_listener)
+
+    task = asyncio.create_task(event_bus.publish("slow.event", "test"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await asyncio.sleep(0)
+    assert outcomes == ["cancelled", "cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_batch_publish_listener_failures(event_bus):
+    """Test that failing listeners are surfaced and fully handled when batch publishing"""
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    received = []
+
+    @event_bus.on("batch.event")
+    async def failing_listener(msg):
+        raise ValueError(f"Listener failed: {msg}")
+
+    @event_bus.on("batch.event")
+    async def working_listener(msg):
+        received.append(msg)
+
+    with pytest.raises(ValueError):
+        await event_bus.batch_publish("batch.event", range(3))
+
+    # Let the remaining listeners finish and be collected
+    await asyncio.sleep(0)
+    gc.collect()
+    assert unhandled == []
+    assert received == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_return_type_validation(event_bus):
+    """Test which return annotations are checked against the handler's response"""
+
+    # Test unions of classes are checked
+    async def union_handler(msg: Message[object]) -> int | str:
+        return msg.body
+
+    event_bus.consumer("union.address", union_handler)
+    assert await event_bus.request("union.address", 1) == 1
+    assert await event_bus.request("union.address", "one") == "one"
+    with pytest.raises(HandlerExecutionError) as exc_info:
+        await event_bus.request("union.address", 1.5)
+    assert "returned an invalid type" in str(exc_info.value)
+
+    # Test parametrized generics are not checked (only their origin could be, which would be misleading)
+    async def generic_handler(msg: Message[object]) -> list[int]:
+        return msg.body  # noqa Deliberately not a list[int]
+
+    event_bus.consumer("generic.address", generic_handler)
+    assert await event_bus.request("generic.address", [1]) == [1]
+    assert await event_bus.request("generic.address", ["x"]) == ["x"]
+
+    # Test bare typing aliases are checked against their origin class
+    async def alias_handler(msg: Message[object]) -> List:
+        return msg.body
+
+    event_bus.consumer("alias.address", alias_handler)
+    assert await event_bus.request("alias.address", [1]) == [1]
+    with pytest.raises(HandlerExecutionError) as exc_info:
+        await event_bus.request("alias.address", 1)
+    assert "expected 'List', got 'int'" in str(exc_info.value)
+
+    # Test Any (alone or in a union) accepts every response
+    async def any_handler(msg: Message[object]) -> Any:
+        return msg.body
+
+    async def optional_any_handler(msg: Message[object]) -> Optional[Any]:
+        return msg.body
+
+    event_bus.consumer("any.address", any_handler)
+    event_bus.consumer("optional.any.address", optional_any_handler)
+    assert await event_bus.request("any.address", 1) == 1
+    assert await event_bus.request("optional.any.address", "one") == "one"
+
+    # Test failing instance checks are still reported as handler errors
+    class BrokenMeta(type):
+        def __instancecheck__(cls, instance):
+            raise RuntimeError("Instance check failed")
+
+    class Broken(metaclass=BrokenMeta):
+        pass
+
+    async def broken_handler(msg: Message[object]) -> Broken:
+        return msg.body
+
+    event_bus.consumer("broken.address", broken_handler)
+    with pytest.raises(HandlerExecutionError) as exc_info:
+        await event_bus.request("broken.address", 1)
+    assert isinstance(exc_info.value.original_error, RuntimeError)
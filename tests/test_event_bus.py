@@ -22,12 +22,16 @@
 
 import pytest
 import asyncio
+import gc
 import uuid
+import weakref
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 from pydantic import BaseModel
 from fixtures import TestRequest, TestResponse
 
+from tinybus import handler
 from tinybus.models import DeliveryOptions, Message
 from tinybus.exceptions import HandlerAlreadyRegisteredError, HandlerNotFoundError, EventBusError
 
@@ -62,6 +66,33 @@ async def test_consumer_registration(event_bus):
     assert "test.address" not in event_bus.get_consumers()
 
 
+@pytest.mark.asyncio
+async def test_handler_decorator(event_bus, monkeypatch):
+    """Test handlers whose type hints are resolved at definition time"""
+
+    @handler
+    async def decorated_handler(msg: Message[TestRequest]) -> TestResponse:
+        if msg.body.value == "invalid":
+            return {"invalid": "response"}  # noqa Not a proper TestResponse model
+        return TestResponse(result=f"Processed: {msg.body.value}")
+
+    assert decorated_handler.__tinybus_return__ is TestResponse
+
+    # Registering a decorated handler must not inspect its type hints again
+    def fail_get_type_hints(obj, *args, **kwargs):
+        raise AssertionError(f"Type hints of {obj!r} resolved at registration")
+
+    monkeypatch.setattr("tinybus.base.get_type_hints", fail_get_type_hints)
+
+    event_bus.consumer("decorated.address", decorated_handler)
+    response = await event_bus.request("decorated.address", TestRequest(value="hello"))
+    assert response.result == "Processed: hello"
+
+    with pytest.raises(EventBusError) as exc_info:
+        await event_bus.request("decorated.address", TestRequest(value="invalid"))
+    assert "returned an invalid type" in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_request_response(event_bus):
     """Test request-response pattern"""
@@ -90,6 +121,10 @@ async def test_request_response(event_bus):
         await event_bus.request("slow.address", request, options=DeliveryOptions(timeout=0.1))
     assert "timed out" in str(exc_info.value)
 
+    # Test requests without a timeout
+    response = await event_bus.request("test.address", request, options=DeliveryOptions(timeout=None))
+    assert response.result == "Processed: hello"
+
     # Test handler error
     async def error_handler(msg: Message[TestRequest]) -> TestResponse:
         raise ValueError("Something went wrong")
@@ -100,6 +135,86 @@ async def test_request_response(event_bus):
     assert "Something went wrong" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_raw_payload_handlers(event_bus):
+    """Test handlers that take the payload itself instead of a Message"""
+
+    async def raw_handler(request: TestRequest) -> TestResponse:
+        return TestResponse(result=f"Processed: {request.value}")
+
+    async def any_handler(msg: Any) -> str:
+        return msg.body
+
+    async def base_handler(msg: BaseModel) -> str:
+        return msg.body.value
+
+    class Service:
+        async def handle(self, request: TestRequest) -> TestResponse:
+            return TestResponse(result=f"Service: {request.value}")
+
+        @handler
+        async def handle_decorated(self, request: TestRequest) -> TestResponse:
+            return TestResponse(result=f"Decorated service: {request.value}")
+
+    event_bus.consumer("raw.address", raw_handler)
+    event_bus.consumer("any.address", any_handler)
+    event_bus.consumer("base.address", base_handler)
+    event_bus.consumer("service.address", Service().handle)
+    event_bus.consumer("decorated.service.address", Service().handle_decorated)
+
+    response = await event_bus.request("raw.address", TestRequest(value="hello"))
+    assert response.result == "Processed: hello"
+
+    response = await event_bus.request("service.address", TestRequest(value="hello"))
+    assert response.result == "Service: hello"
+
+    response = await event_bus.request("decorated.service.address", TestRequest(value="hello"))
+    assert response.result == "Decorated service: hello"
+
+    # Handlers annotated with Any still get the Message envelope
+    response = await event_bus.request("any.address", "hello")
+    assert response == "hello"
+
+    # So do handlers annotated with a base class of Message
+    response = await event_bus.request("base.address", TestRequest(value="hello"))
+    assert response == "hello"
+
+
+@pytest.mark.asyncio
+async def test_handler_lifetimes(event_bus):
+    """Test registering unhashable and short-lived handlers"""
+
+    # Test unhashable callable handlers
+    @dataclass
+    class CallableHandler:
+        prefix: str
+
+        async def __call__(self, msg: Message[TestRequest]) -> TestResponse:
+            return TestResponse(result=f"{self.prefix}: {msg.body.value}")
+
+    event_bus.consumer("callable.address", CallableHandler(prefix="Callable"))
+    response = await event_bus.request("callable.address", TestRequest(value="hello"))
+    assert response.result == "Callable: hello"
+
+    # Test removed handlers are not kept alive by the event bus
+    def make_handler():
+        async def closure_handler(request: TestRequest) -> TestResponse:
+            return TestResponse(result=f"Closure: {request.value}")
+
+        return closure_handler
+
+    closure_handler = make_handler()
+    handler_ref = weakref.ref(closure_handler)
+    consumer = event_bus.consumer("closure.address", closure_handler)
+    response = await event_bus.request("closure.address", TestRequest(value="hello"))
+    assert response.result == "Closure: hello"
+
+    consumer.unregister()
+    del consumer, closure_handler
+    gc.collect()
+    assert handler_ref() is None
+
+
 @pytest.mark.asyncio
 async def test_publish_subscribe(event_bus):
     """Test publish-subscribe pattern"""
@@ -173,6 +288,26 @@ async def test_message_validation(event_bus):
     response = await event_bus.request("null.address", None)
     assert response == "Processed null message"
 
+    # Test the envelope handlers receive
+    received = []
+
+    async def envelope_handler(msg: Message[TestRequest]) -> None:
+        received.append(msg)
+
+    event_bus.consumer("envelope.address", envelope_handler)
+    request = TestRequest(value="test")
+    await event_bus.request("envelope.address", request)
+    await event_bus.request("envelope.address", request)
+
+    first, second = received
+    assert first.body is request
+    assert first.reply_address is None
+    assert isinstance(first.id, str) and first.id == first.id
+    assert first.id != second.id
+    assert not isinstance(first, Message)
+    with pytest.raises(AttributeError):
+        first.body = None  # noqa The envelope is read-only
+
     # Test message ID uniqueness
     messages = set()
     for _ in range(100):
@@ -180,6 +315,10 @@ async def test_message_validation(event_bus):
         messages.add(msg.id)
     assert len(messages) == 100
 
+    # Test default message IDs are generated per instance
+    messages = {Message[str].create("test").id for _ in range(100)}
+    assert len(messages) == 100
+
 
 @pytest.mark.asyncio
 async def test_error_handling(event_bus):
@@ -258,6 +397,13 @@ async def test_performance_edges(event_bus):
     ])
     assert counter == 100
 
+    # Publish many events in a single batch
+    await event_bus.batch_publish("high.frequency", range(100))
+    assert counter == 200
+
+    # Batches without listeners are a no-op
+    await event_bus.batch_publish("no.listeners", range(100))
+
 
 @pytest.mark.asyncio
 async def test_advanced_patterns(event_bus):
@@ -24,179 +24,155 @@ import pytest
 import asyncio
 import time
 
-from typing import List
-from dataclasses import dataclass
+from array import array
+from itertools import count
+from statistics import fmean
 from fixtures import TestRequest, TestResponse
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
 
-@dataclass
-class LoadTestMetrics:
-    total_time: float
-    requests_per_second: float
-    success_count: int
-    error_count: int
-    avg_response_time: float
 
+@pytest.fixture(scope="module")
+def runner():
+    """Runs the load tests on uvloop when it is installed, the other tests keep the stdlib loop"""
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None) as runner:
+        yield runner
 
-async def measure_request_latency(event_bus, request: TestRequest) -> float:
-    start = time.perf_counter()
-    await event_bus.request("test.address", request)
-    return time.perf_counter() - start
 
+async def _run_load(
+        event_bus,
+        num_requests: int,
+        num_events: int,
+        listener_count: int,
+        concurrency: int = 100
+) -> tuple[float, float, int, int, int]:
+    """
+    Drive interleaved requests and publishes through the event bus.
 
-@pytest.mark.asyncio
-async def test_request_response_load(event_bus):
-    """Test request-response pattern under load"""
+    Returns:
+        Total time, average request latency (both in seconds), errors, processed requests and
+        received events
+    """
+    processed = count()
+    received = count()
 
-    # Setup handler
+    # Setup request handler
     async def handler(msg):
-        await asyncio.sleep(0.001)  # Simulate some work
+        await asyncio.sleep(0)  # Yield to the loop like real work would
+        next(processed)
         return TestResponse(result=f"Processed: {msg.body.value}")
 
-    event_bus.consumer("test.address", handler)
-
-    # Test parameters
-    num_requests = 1000
-    concurrent_requests = 100
-
-    # Create requests
-    requests = [TestRequest(value=f"request_{i}") for i in range(num_requests)]
-    latencies: List[float] = []
-    errors = 0
-
-    start_time = time.perf_counter()
-
-    # Process requests in batches
-    for i in range(0, num_requests, concurrent_requests):
-        batch = requests[i:i + concurrent_requests]
-        tasks = [measure_request_latency(event_bus, req) for req in batch]
-        batch_latencies = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for latency in batch_latencies:
-            if isinstance(latency, Exception):
-                errors += 1
-            else:
-                latencies.append(latency)
-
-    total_time = time.perf_counter() - start_time
-
-    metrics = LoadTestMetrics(
-        total_time=total_time,
-        requests_per_second=num_requests / total_time,
-        success_count=len(latencies),
-        error_count=errors,
-        avg_response_time=sum(latencies) / len(latencies) if latencies else 0
-    )
-
-    print(f"\nRequest-Response Load Test Results:")
-    print(f"Total time: {metrics.total_time:.2f}s")
-    print(f"Requests/second: {metrics.requests_per_second:.2f}")
-    print(f"Success rate: {(metrics.success_count / num_requests) * 100:.1f}%")
-    print(f"Average response time: {metrics.avg_response_time * 1000:.2f}ms")
-
-    assert metrics.error_count == 0
-    assert metrics.requests_per_second > 100  # Should handle at least 100 req/s
-    assert metrics.avg_response_time < 0.1  # Average response under 100ms
-
-
-@pytest.mark.asyncio
-async def test_publish_subscribe_load(event_bus):
-    """Test publish-subscribe pattern under load"""
-    received_count = 0
-    listener_count = 50
-    message_count = 1000
+    # Setup distinct event listeners so publishing actually fans out
+    def make_listener():
+        async def listener(msg):
+            await asyncio.sleep(0)  # Yield to the loop like real work would
+            next(received)
 
-    # Register multiple listeners
-    async def listener(msg):
-        nonlocal received_count
-        await asyncio.sleep(0.001)  # Simulate work
-        received_count += 1
+        return listener
 
+    event_bus.consumer("test.address", handler)
     for _ in range(listener_count):
-        event_bus.on("test.event", listener)
+        event_bus.on("test.event", make_listener())
 
-    start_time = time.perf_counter()
+    # Shared payloads keep their construction out of the measurement
+    request = TestRequest(value="request")
+    event = TestRequest(value="event")
 
-    # Publish messages in parallel
-    publish_tasks = [
-        event_bus.publish("test.event", TestRequest(value=f"event_{i}"))
-        for i in range(message_count)
-    ]
-    await asyncio.gather(*publish_tasks)
+    # Latencies are stored unboxed, as integer nanoseconds, in a buffer sized for every request up front
+    latencies = array('q', [0]) * num_requests
+    recorded = 0
+    errors = 0
 
-    total_time = time.perf_counter() - start_time
-    expected_total = message_count * listener_count
-
-    metrics = LoadTestMetrics(
-        total_time=total_time,
-        requests_per_second=message_count / total_time,
-        success_count=received_count,
-        error_count=expected_total - received_count,
-        avg_response_time=total_time / message_count
-    )
+    # Failures are counted where they happen so one failing operation doesn't cancel the whole run
+    async def timed() -> None:
+        nonlocal recorded, errors
+        start = time.perf_counter_ns()
+        try:
+            await event_bus.request("test.address", request)
+        except Exception:
+            errors += 1
+        else:
+            latencies[recorded] = time.perf_counter_ns() - start
+            recorded += 1
+
+    async def published() -> None:
+        nonlocal errors
+        try:
+            await event_bus.publish("test.event", event)
+        except Exception:
+            errors += 1
+
+    # Warm up the bus hot paths so cold caches and first-call costs stay out of the measurement
+    for _ in range(10):
+        if num_requests:
+            await event_bus.request("test.address", request)
+        if num_events:
+            await event_bus.publish("test.event", event)
+
+    # Discard the deliveries made while warming up
+    processed = count()
+    received = count()
 
-    print(f"\nPublish-Subscribe Load Test Results:")
-    print(f"Total time: {metrics.total_time:.2f}s")
-    print(f"Messages/second: {metrics.requests_per_second:.2f}")
-    print(f"Total events processed: {metrics.success_count}")
-    print(f"Average processing time per message: {metrics.avg_response_time * 1000:.2f}ms")
+    start_time = time.perf_counter()
 
-    assert metrics.error_count == 0
-    assert metrics.success_count == expected_total
-    assert metrics.requests_per_second > 50  # Should handle at least 50 msg/s
+    # A fixed pool of workers drains a bounded queue, so at most `concurrency` operations are in flight
+    # and producing them blocks (instead of piling up tasks) when the workers fall behind
+    queue = asyncio.Queue(maxsize=concurrency)
 
+    async def worker() -> None:
+        while (operation := await queue.get()) is not None:
+            await operation()
 
-@pytest.mark.asyncio
-async def test_mixed_load(event_bus):
-    """Test both patterns simultaneously under load"""
-    received_events = 0
-    processed_requests = 0
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(concurrency):
+            tg.create_task(worker())
 
-    # Setup request handler
-    async def request_handler(msg):
-        nonlocal processed_requests
-        await asyncio.sleep(0.001)
-        processed_requests += 1
-        return TestResponse(result=f"Processed: {msg.body.value}")
+        # Interleave requests and publishes
+        for i in range(max(num_requests, num_events)):
+            if i < num_requests:
+                await queue.put(timed)
+            if i < num_events:
+                await queue.put(published)
 
-    # Setup event listener
-    async def event_listener(msg):
-        nonlocal received_events
-        await asyncio.sleep(0.001)
-        received_events += 1
+        # One sentinel per worker to let them all finish
+        for _ in range(concurrency):
+            await queue.put(None)
 
-    event_bus.consumer("test.address", request_handler)
-    for _ in range(10):  # 10 listeners
-        event_bus.on("test.event", event_listener)
-
-    # Test parameters
-    num_requests = 500
-    num_events = 500
+    total_time = time.perf_counter() - start_time
+    avg_response_time = fmean(latencies[:recorded]) / 1e9 if recorded else 0
 
-    start_time = time.perf_counter()
+    # count() yields the number of previous increments
+    return total_time, avg_response_time, errors, next(processed), next(received)
 
-    # Mix request-response and publish-subscribe
-    request_tasks = [
-        event_bus.request("test.address", TestRequest(value=f"req_{i}"))
-        for i in range(num_requests)
-    ]
 
-    publish_tasks = [
-        event_bus.publish("test.event", TestRequest(value=f"event_{i}"))
-        for i in range(num_events)
+@pytest.mark.parametrize(
+    "pattern, num_requests, num_events, listener_count, min_throughput",
+    [
+        ("Request-Response", 1000, 0, 0, 100),  # Should handle at least 100 req/s
+        ("Publish-Subscribe", 0, 1000, 50, 50),  # Should handle at least 50 msg/s
+        ("Mixed", 500, 500, 10, 50),
     ]
+)
+def test_load(runner, event_bus, pattern, num_requests, num_events, listener_count, min_throughput):
+    """Test request-response, publish-subscribe and both patterns simultaneously under load"""
+    total_time, avg_response_time, errors, processed_requests, received_events = runner.run(
+        _run_load(event_bus, num_requests, num_events, listener_count)
+    )
+    throughput = (num_requests + num_events) / total_time
 
-    # Run everything concurrently
-    await asyncio.gather(*(request_tasks + publish_tasks))
-
-    total_time = time.perf_counter() - start_time
-    expected_events = num_events * 10  # 10 listeners
-
-    print(f"\nMixed Load Test Results:")
+    print(f"\n{pattern} Load Test Results:")
     print(f"Total time: {total_time:.2f}s")
-    print(f"Total throughput: {(num_requests + num_events) / total_time:.2f} ops/s")
+    print(f"Throughput: {throughput:.2f} ops/s")
     print(f"Requests processed: {processed_requests}")
     print(f"Events processed: {received_events}")
+    if num_requests:
+        print(f"Average response time: {avg_response_time * 1000:.2f}ms")
 
+    assert errors == 0
     assert processed_requests == num_requests
-    assert received_events == expected_events
+    assert received_events == num_events * listener_count
+    assert throughput > min_throughput
+    assert avg_response_time < 0.1  # Average response under 100ms